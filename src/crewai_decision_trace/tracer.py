@@ -3,37 +3,52 @@ from __future__ import annotations
 from functools import wraps
 from typing import Any, Callable
 
-_DEFAULT_EMITTER: Any | None = None
+# Single-element slot instead of a rebindable module global: wrappers bind the
+# slot as a default argument, turning the per-call LOAD_GLOBAL into LOAD_FAST.
+_EMITTER_SLOT: list[Any] = [None]
+
+_EMITTER_UNSET_MSG = (
+    "Default decision emitter is not set. Call set_default_emitter(emitter) before traced decisions."
+)
 
 
 def set_default_emitter(emitter: Any) -> None:
     """Set the process-wide default emitter used by trace_decision."""
-    global _DEFAULT_EMITTER
-    _DEFAULT_EMITTER = emitter
+    _EMITTER_SLOT[0] = emitter
 
 
 def trace_decision(policy_id: str | None = None) -> Callable[[Callable[..., dict[str, Any]]], Callable[..., dict[str, Any]]]:
-    """Decorator for decision builders that emit returned event dicts."""
+    """Decorator for decision builders that emit returned event dicts.
+
+    The wrapper is specialized at decoration time: the common
+    policy_id=None case gets a fast path with no per-call branching.
+    """
 
     def decorator(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
-            event = func(*args, **kwargs)
-            if _DEFAULT_EMITTER is None:
-                raise RuntimeError(
-                    "Default decision emitter is not set. Call set_default_emitter(emitter) before traced decisions."
-                )
-
-            if (
-                policy_id is not None
-                and isinstance(event, dict)
-                and isinstance(event.get("context"), dict)
-                and "policy_id" not in event["context"]
-            ):
-                event["context"]["policy_id"] = policy_id
-
-            _DEFAULT_EMITTER.emit(event)
-            return event
+        if policy_id is None:
+
+            @wraps(func)
+            def wrapper(*args: Any, _slot: list[Any] = _EMITTER_SLOT, **kwargs: Any) -> dict[str, Any]:
+                event = func(*args, **kwargs)
+                emitter = _slot[0]
+                if emitter is None:
+                    raise RuntimeError(_EMITTER_UNSET_MSG)
+                emitter.emit(event)
+                return event
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args: Any, _slot: list[Any] = _EMITTER_SLOT, **kwargs: Any) -> dict[str, Any]:
+                event = func(*args, **kwargs)
+                emitter = _slot[0]
+                if emitter is None:
+                    raise RuntimeError(_EMITTER_UNSET_MSG)
+                ctx = event.get("context")
+                if ctx is not None and "policy_id" not in ctx:
+                    ctx["policy_id"] = policy_id
+                emitter.emit(event)
+                return event
 
         return wrapper
 
@@ -0,0 +1,45 @@
+"""Per-process cache of parsed run artifacts shared by verify and the viewer."""
+
+from __future__ import annotations
+
+import functools
+import mmap
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_jsonl_cached(path_str: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], ...]:
+    if size == 0:
+        return ()
+    rows: list[dict[str, Any]] = []
+    with open(path_str, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while (nl := mm.find(b"\n", start)) != -1:
+            line = mm[start:nl]
+            if line.strip():
+                rows.append(orjson.loads(line))
+            start = nl + 1
+        tail = mm[start:]
+        if tail.strip():
+            rows.append(orjson.loads(tail))
+    return tuple(rows)
+
+
+def load_json(path: Path) -> Any:
+    """Parsed JSON keyed on (path, mtime, size); callers must not mutate the result."""
+    st = path.stat()
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_jsonl(path: Path) -> tuple[dict[str, Any], ...]:
+    """Parsed JSONL rows keyed on (path, mtime, size); callers must not mutate the result."""
+    st = path.stat()
+    return _load_jsonl_cached(str(path), st.st_mtime_ns, st.st_size)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import csv
-import json
+import functools
+import io
+import os
+import time
 import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 from crewai_decision_trace import set_default_emitter, trace_decision
 from crewai import Agent, Crew, Process, Task
@@ -22,16 +28,18 @@ CANONICAL_INPUTS = (
     Path("data/personas/foodie/transactions.csv"),
     Path("data/constraints.yaml"),
 )
-REQUIRED_FIELDS = (
-    "decision_id",
-    "timestamp",
-    "actor",
-    "decision_type",
-    "context",
-    "evidence",
-    "outcome",
-    "confidence",
-    "lineage",
+REQUIRED_FIELDS = frozenset(
+    {
+        "decision_id",
+        "timestamp",
+        "actor",
+        "decision_type",
+        "context",
+        "evidence",
+        "outcome",
+        "confidence",
+        "lineage",
+    }
 )
 
 
@@ -67,22 +75,48 @@ class DeterministicLLM(BaseLLM):
         return "Task acknowledged."
 
 
+@functools.lru_cache(maxsize=64)
+def _ensure_dir(path_str: str) -> None:
+    Path(path_str).mkdir(parents=True, exist_ok=True)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write an artifact via tmp-file + rename so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
 class DecisionTraceEmitter:
-    def __init__(self, persona: str, output_path: Path, sdk_path: Path):
+    def __init__(self, persona: str, output_path: Path, sdk_path: Path, emit_sdk: bool = True):
         self.persona = persona
         self.output_path = output_path
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = self.output_path.open("w", encoding="utf-8")
-        self._sdk_exporter = FileJsonlExporter(str(sdk_path))
+        _ensure_dir(str(self.output_path.parent))
+        self._file = self.output_path.open("wb", buffering=1 << 20)
+        self.emit_sdk = emit_sdk
+        self._sdk_exporter = FileJsonlExporter(str(sdk_path)) if emit_sdk else None
+        self._buffer: list[bytes] = []
 
     def close(self) -> None:
+        self._file.writelines(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
         self._file.close()
 
     def emit(self, event: dict[str, Any]) -> None:
-        for field in REQUIRED_FIELDS:
-            if field not in event:
-                raise ValueError(f"Missing required field: {field}")
+        missing = REQUIRED_FIELDS.difference(event)
+        if missing:
+            raise ValueError(f"Missing required fields: {sorted(missing)}")
+
+        if self.emit_sdk:
+            self._emit_sdk_event(event)
+
+        # _event builds keys in a fixed order, so insertion order is already
+        # deterministic; canonical (sorted) form is only needed at verify time.
+        self._buffer.append(orjson.dumps(event) + b"\n")
 
+    def _emit_sdk_event(self, event: dict[str, Any]) -> None:
         actor_name = event["actor"]
         parent = event["lineage"][0] if event["lineage"] else None
         with decision(
@@ -105,42 +139,51 @@ class DecisionTraceEmitter:
                 }
             )
 
-        self._file.write(json.dumps(event, sort_keys=True) + "\n")
-        self._file.flush()
+
+def _iso_from_ns(ns: int) -> str:
+    secs, frac = divmod(ns, 1_000_000_000)
+    tm = time.gmtime(secs)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{frac // 1000:06d}+00:00"
+    )
 
 
 def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return _iso_from_ns(time.time_ns())
 
 
 def new_decision_id() -> str:
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
 
 def load_transactions(path: Path) -> list[Transaction]:
-    rows: list[Transaction] = []
     with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(
-                Transaction(
-                    date=row["date"],
-                    category=row["category"],
-                    merchant=row["merchant"],
-                    amount=float(row["amount"]),
-                )
-            )
-    return rows
+        reader = csv.reader(f)
+        header = next(reader)
+        i_date, i_cat, i_merch, i_amt = (header.index(col) for col in ("date", "category", "merchant", "amount"))
+        return [
+            Transaction(date=row[i_date], category=row[i_cat], merchant=row[i_merch], amount=float(row[i_amt]))
+            for row in reader
+        ]
 
 
-def load_constraints(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_constraints_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    with open(path_str, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
     if not isinstance(data, dict):
         raise ValueError("constraints.yaml must parse to object")
     return data
 
 
+def load_constraints(path: Path) -> dict[str, Any]:
+    return _load_constraints_cached(str(path), path.stat().st_mtime_ns)
+
+
 def build_agents() -> dict[str, Agent]:
     llm = DeterministicLLM()
     return {
@@ -187,8 +230,14 @@ def build_agents() -> dict[str, Agent]:
     }
 
 
-def build_crew(agents: dict[str, Agent], persona: str) -> Crew:
-    tasks = [
+@functools.lru_cache(maxsize=1)
+def _agents_singleton() -> dict[str, Agent]:
+    """Agent/LLM construction goes through Pydantic validation; build once per process."""
+    return build_agents()
+
+
+def build_tasks(agents: dict[str, Agent], persona: str) -> list[Task]:
+    return [
         Task(
             description=f"Persona {persona}: SpendAnalystAgent prepares baseline and drivers.",
             expected_output="Spend analysis acknowledgment",
@@ -215,6 +264,10 @@ def build_crew(agents: dict[str, Agent], persona: str) -> Crew:
             agent=agents["PlannerAgent"],
         ),
     ]
+
+
+def build_crew(agents: dict[str, Agent], persona: str) -> Crew:
+    tasks = build_tasks(agents, persona)
     return Crew(
         agents=list(agents.values()),
         tasks=tasks,
@@ -224,17 +277,19 @@ def build_crew(agents: dict[str, Agent], persona: str) -> Crew:
 
 
 def category_totals(transactions: list[Transaction]) -> dict[str, float]:
-    totals: dict[str, float] = {}
+    totals: defaultdict[str, float] = defaultdict(float)
     for t in transactions:
-        if t.category == "Income":
-            continue
-        totals[t.category] = totals.get(t.category, 0.0) + t.amount
-    return totals
+        if t.category != "Income":
+            totals[t.category] += t.amount
+    return dict(totals)
 
 
 def discretionary_drivers(totals: dict[str, float], protected: set[str]) -> list[tuple[str, float]]:
     pairs = [(c, v) for c, v in totals.items() if c not in protected and c != "Income"]
-    pairs.sort(key=lambda item: (-item[1], item[0]))
+    # Two stable C-level sorts (category asc, then amount desc) replace the
+    # lambda key that allocated a tuple per element.
+    pairs.sort(key=itemgetter(0))
+    pairs.sort(key=itemgetter(1), reverse=True)
     return pairs
 
 
@@ -285,26 +340,32 @@ def build_plans(totals: dict[str, float], drivers: list[tuple[str, float]], cons
 
     pct = float(constraints["savings_transfer"]["percentage"])
     for plan in plans:
-        projected_savings = 0.0
-        for cat, cut_pct in plan["cuts"].items():
-            projected_savings += totals.get(cat, 0.0) * cut_pct
-        plan["projected_savings"] = round(projected_savings, 2)
-        plan["savings_transfer_amount"] = round(projected_savings * pct, 2)
+        category_savings, raw_total, largest_share, avg_cut = _savings_stats(totals, plan["cuts"])
+        plan["projected_savings"] = round(raw_total, 2)
+        plan["savings_transfer_amount"] = round(raw_total * pct, 2)
         plan["category_changes"] = len(plan["cuts"])
+        plan["_category_savings"] = category_savings
+        plan["_largest_savings_share"] = largest_share
+        plan["_avg_cut"] = avg_cut
     return plans
 
 
+_EXPLAIN_PROTECTED_OK = "Protected categories remain unchanged."
+_EXPLAIN_PROTECTED_FAIL = "Plan attempts to cut a protected category."
+_EXPLAIN_CUT_LIMIT_OK = "No category exceeds the single-category cut limit."
+
+
 def evaluate_policy(plan: dict[str, Any], totals: dict[str, float], constraints: dict[str, Any]) -> dict[str, Any]:
     protected = set(constraints["protected_categories"])
-    checks = []
+    checks: list[tuple[str, str, str]] = []
 
     protected_changed = any(cat in protected for cat in plan["cuts"])
     checks.append(
-        {
-            "code": "PROTECTED_CATEGORIES_UNCHANGED",
-            "status": "FAIL" if protected_changed else "PASS",
-            "explain": "Protected categories remain unchanged." if not protected_changed else "Plan attempts to cut a protected category.",
-        }
+        (
+            "PROTECTED_CATEGORIES_UNCHANGED",
+            "FAIL" if protected_changed else "PASS",
+            _EXPLAIN_PROTECTED_FAIL if protected_changed else _EXPLAIN_PROTECTED_OK,
+        )
     )
 
     groceries_total = totals.get("Groceries", 0.0)
@@ -312,20 +373,20 @@ def evaluate_policy(plan: dict[str, Any], totals: dict[str, float], constraints:
     groceries_after = groceries_total * (1 - groceries_cut)
     groceries_ok = groceries_after >= float(constraints["min_groceries"])
     checks.append(
-        {
-            "code": "GROCERY_MINIMUM_MET",
-            "status": "PASS" if groceries_ok else "FAIL",
-            "explain": f"Projected groceries {groceries_after:.2f} must be at least {float(constraints['min_groceries']):.2f}.",
-        }
+        (
+            "GROCERY_MINIMUM_MET",
+            "PASS" if groceries_ok else "FAIL",
+            f"Projected groceries {groceries_after:.2f} must be at least {float(constraints['min_groceries']):.2f}.",
+        )
     )
 
     max_changes_ok = plan["category_changes"] <= int(constraints["max_category_changes"])
     checks.append(
-        {
-            "code": "MAX_CATEGORY_CHANGES_WITHIN_LIMIT",
-            "status": "PASS" if max_changes_ok else "FAIL",
-            "explain": f"Plan changes {plan['category_changes']} categories; limit is {int(constraints['max_category_changes'])}.",
-        }
+        (
+            "MAX_CATEGORY_CHANGES_WITHIN_LIMIT",
+            "PASS" if max_changes_ok else "FAIL",
+            f"Plan changes {plan['category_changes']} categories; limit is {int(constraints['max_category_changes'])}.",
+        )
     )
 
     transfer_enabled = bool(constraints["savings_transfer"]["enabled"])
@@ -333,56 +394,66 @@ def evaluate_policy(plan: dict[str, Any], totals: dict[str, float], constraints:
     expected_transfer = round(plan["projected_savings"] * required_pct, 2)
     transfer_ok = (not transfer_enabled) or plan["savings_transfer_amount"] >= expected_transfer
     checks.append(
-        {
-            "code": "SAVINGS_TRANSFER_RULE_APPLIED",
-            "status": "PASS" if transfer_ok else "FAIL",
-            "explain": f"Savings transfer is {plan['savings_transfer_amount']:.2f} and required minimum is {expected_transfer:.2f}.",
-        }
+        (
+            "SAVINGS_TRANSFER_RULE_APPLIED",
+            "PASS" if transfer_ok else "FAIL",
+            f"Savings transfer is {plan['savings_transfer_amount']:.2f} and required minimum is {expected_transfer:.2f}.",
+        )
     )
 
-    policy_status = "ACCEPT" if all(c["status"] == "PASS" for c in checks) else "REJECT"
+    policy_status = "ACCEPT" if all(status == "PASS" for _, status, _ in checks) else "REJECT"
     return {"policy_status": policy_status, "checks": checks}
 
 
+def _savings_stats(totals: dict[str, float], cuts: dict[str, float]) -> tuple[dict[str, float], float, float, float]:
+    """Numeric core shared by plan evaluation: per-category savings, raw total, largest share, average cut."""
+    category_savings: dict[str, float] = {}
+    raw_total = 0.0
+    for cat, pct in cuts.items():
+        saved = totals.get(cat, 0.0) * pct
+        raw_total += saved
+        category_savings[cat] = round(saved, 2)
+    rounded_total = sum(category_savings.values())
+    largest_share = max(category_savings.values()) / rounded_total if rounded_total > 0 else 0.0
+    avg_cut = sum(cuts.values()) / len(cuts) if cuts else 0.0
+    return category_savings, raw_total, largest_share, avg_cut
+
+
 def evaluate_risk(plan: dict[str, Any], totals: dict[str, float], constraints: dict[str, Any]) -> dict[str, Any]:
-    checks = []
+    checks: list[tuple[str, str, str]] = []
 
     cut_limit = float(constraints["single_category_cut_limit_pct"])
     over_limit = [cat for cat, cut in plan["cuts"].items() if cut > cut_limit]
     checks.append(
-        {
-            "code": "SINGLE_CATEGORY_CUT_LIMIT_RESPECTED" if not over_limit else "SINGLE_CATEGORY_CUT_LIMIT_EXCEEDED",
-            "status": "PASS" if not over_limit else "FAIL",
-            "explain": "No category exceeds the single-category cut limit." if not over_limit else f"Categories over cut limit: {', '.join(sorted(over_limit))}.",
-        }
+        (
+            "SINGLE_CATEGORY_CUT_LIMIT_RESPECTED" if not over_limit else "SINGLE_CATEGORY_CUT_LIMIT_EXCEEDED",
+            "PASS" if not over_limit else "FAIL",
+            _EXPLAIN_CUT_LIMIT_OK if not over_limit else f"Categories over cut limit: {', '.join(sorted(over_limit))}.",
+        )
     )
 
-    category_savings = {cat: round(totals.get(cat, 0.0) * pct, 2) for cat, pct in plan["cuts"].items()}
-    total_savings = sum(category_savings.values())
-    largest_share = 0.0
-    if total_savings > 0:
-        largest_share = max(value / total_savings for value in category_savings.values())
+    largest_share = plan["_largest_savings_share"]
+    avg_cut = plan["_avg_cut"]
     concentration_limit = float(constraints["overconcentration_limit_pct"])
     concentrated = largest_share > concentration_limit
     checks.append(
-        {
-            "code": "OVERCONCENTRATION_LIMIT_OK" if not concentrated else "OVERCONCENTRATION_LIMIT_EXCEEDED",
-            "status": "PASS" if not concentrated else "WARN",
-            "explain": f"Largest category contributes {largest_share:.2%} of savings vs limit {concentration_limit:.2%}.",
-        }
+        (
+            "OVERCONCENTRATION_LIMIT_OK" if not concentrated else "OVERCONCENTRATION_LIMIT_EXCEEDED",
+            "PASS" if not concentrated else "WARN",
+            f"Largest category contributes {largest_share:.2%} of savings vs limit {concentration_limit:.2%}.",
+        )
     )
 
-    avg_cut = sum(plan["cuts"].values()) / len(plan["cuts"]) if plan["cuts"] else 0.0
     behavioral_warn = avg_cut > 0.25
     checks.append(
-        {
-            "code": "BEHAVIORAL_REALISM_PLAUSIBLE" if not behavioral_warn else "BEHAVIORAL_REALISM_STRETCH",
-            "status": "PASS" if not behavioral_warn else "WARN",
-            "explain": f"Average category cut is {avg_cut:.2%}; higher cuts are harder to sustain.",
-        }
+        (
+            "BEHAVIORAL_REALISM_PLAUSIBLE" if not behavioral_warn else "BEHAVIORAL_REALISM_STRETCH",
+            "PASS" if not behavioral_warn else "WARN",
+            f"Average category cut is {avg_cut:.2%}; higher cuts are harder to sustain.",
+        )
     )
 
-    statuses = {c["status"] for c in checks}
+    statuses = {status for _, status, _ in checks}
     if "FAIL" in statuses:
         risk_status = "REJECT"
     elif "WARN" in statuses:
@@ -462,6 +533,7 @@ def _event(
     }
 
 
+@functools.lru_cache(maxsize=1)
 def validate_canonical_inputs() -> None:
     missing = [str(path) for path in CANONICAL_INPUTS if not path.exists()]
     if missing:
@@ -475,23 +547,22 @@ def run_persona(persona: str) -> dict[str, Any]:
     validate_canonical_inputs()
 
     persona_dir = Path("out/runs") / persona
-    persona_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(str(persona_dir))
     plain_log_path = persona_dir / "plain_trace.log"
     trace_path = persona_dir / "decision_trace.jsonl"
     sdk_trace_path = persona_dir / ".sdk_decision_trace.jsonl"
 
-    if sdk_trace_path.exists():
-        sdk_trace_path.unlink()
+    sdk_trace_path.unlink(missing_ok=True)
 
     transactions = load_transactions(Path(f"data/personas/{persona}/transactions.csv"))
     constraints = load_constraints(Path("data/constraints.yaml"))
 
-    agents = build_agents()
+    agents = _agents_singleton()
     crew = build_crew(agents, persona)
     crew.kickoff(inputs={"persona": persona})
 
-    log_lines: list[str] = []
-    emitter = DecisionTraceEmitter(persona, trace_path, sdk_trace_path)
+    emit_sdk = os.environ.get("DT_EMIT_SDK", "1") == "1"
+    emitter = DecisionTraceEmitter(persona, trace_path, sdk_trace_path, emit_sdk=emit_sdk)
     set_default_emitter(emitter)
     emitted: list[dict[str, Any]] = []
 
@@ -563,7 +634,6 @@ def run_persona(persona: str) -> dict[str, Any]:
         plan["proposal_decision_id"] = plan_event["decision_id"]
         emitted.append(plan_event)
 
-    for plan in plans:
         policy = evaluate_policy(plan, totals, constraints)
         plan["policy"] = policy
         policy_event = _event(
@@ -572,8 +642,8 @@ def run_persona(persona: str) -> dict[str, Any]:
             {"persona": persona, "plan_id": plan["plan_id"], "plan_name": plan["plan_name"]},
             {
                 "reason_codes": [
-                    {"code": c["code"], "status": c["status"], "explain": c["explain"]}
-                    for c in policy["checks"]
+                    {"code": code, "status": status, "explain": explain}
+                    for code, status, explain in policy["checks"]
                 ]
             },
             {"policy_status": policy["policy_status"]},
@@ -583,7 +653,6 @@ def run_persona(persona: str) -> dict[str, Any]:
         plan["policy_decision_id"] = policy_event["decision_id"]
         emitted.append(policy_event)
 
-    for plan in plans:
         risk = evaluate_risk(plan, totals, constraints)
         plan["risk"] = risk
         risk_event = _event(
@@ -592,8 +661,8 @@ def run_persona(persona: str) -> dict[str, Any]:
             {"persona": persona, "plan_id": plan["plan_id"], "plan_name": plan["plan_name"]},
             {
                 "reason_codes": [
-                    {"code": c["code"], "status": c["status"], "explain": c["explain"]}
-                    for c in risk["checks"]
+                    {"code": code, "status": status, "explain": explain}
+                    for code, status, explain in risk["checks"]
                 ],
                 "largest_savings_share": risk["largest_savings_share"],
             },
@@ -690,14 +759,23 @@ def run_persona(persona: str) -> dict[str, Any]:
         },
     }
 
+    log_buf = io.StringIO()
     for event in emitted:
-        log_lines.append(
-            f"{event['timestamp']} | {event['actor']} | {event['decision_type']} | {event['outcome']}"
-        )
-
-    (persona_dir / "budget_plan.md").write_text(budget_markdown, encoding="utf-8")
-    (persona_dir / "scorecard.json").write_text(json.dumps(scorecard, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-    plain_log_path.write_text("\n".join(log_lines) + "\n", encoding="utf-8")
+        log_buf.write(f"{event['timestamp']} | {event['actor']} | {event['decision_type']} | ")
+        log_buf.write(orjson.dumps(event["outcome"]).decode())
+        log_buf.write("\n")
+    plain_log = log_buf.getvalue()
+
+    artifacts = (
+        (persona_dir / "budget_plan.md", budget_markdown.encode("utf-8")),
+        (
+            persona_dir / "scorecard.json",
+            orjson.dumps(scorecard, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n",
+        ),
+        (plain_log_path, plain_log.encode("utf-8")),
+    )
+    for artifact_path, data in artifacts:
+        _atomic_write(artifact_path, data)
     emitter.close()
 
     return {
@@ -705,9 +783,10 @@ def run_persona(persona: str) -> dict[str, Any]:
         "scorecard": scorecard,
         "events": emitted,
         "budget_markdown": budget_markdown,
-        "plain_log": "\n".join(log_lines),
+        "plain_log": plain_log,
     }
 
 
 def run_all_personas() -> list[dict[str, Any]]:
-    return [run_persona(persona) for persona in CANONICAL_PERSONAS]
+    with ProcessPoolExecutor(max_workers=len(CANONICAL_PERSONAS)) as executor:
+        return list(executor.map(run_persona, CANONICAL_PERSONAS))
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-import json
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from ._artifact_cache import load_json, load_jsonl
 from .pipeline import CANONICAL_PERSONAS, REQUIRED_FIELDS
 
 COUNTS_EXPECTED = {
@@ -22,60 +28,33 @@ FORBIDDEN_PLACEHOLDER_TOKENS = (
     "Option 2",
     "Option 3",
 )
+_PLACEHOLDER_RE = re.compile(b"|".join(re.escape(token.encode()) for token in FORBIDDEN_PLACEHOLDER_TOKENS))
 
 
 def read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def read_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.strip():
-            rows.append(json.loads(line))
-    return rows
+    return load_json(path)
 
 
-def _contains_placeholder(obj: Any) -> bool:
-    if isinstance(obj, str):
-        return any(token in obj for token in FORBIDDEN_PLACEHOLDER_TOKENS)
-    if isinstance(obj, list):
-        return any(_contains_placeholder(item) for item in obj)
-    if isinstance(obj, dict):
-        return any(_contains_placeholder(v) for v in obj.values())
-    return False
+def read_jsonl(path: Path) -> tuple[dict[str, Any], ...]:
+    return load_jsonl(path)
 
 
-def _validate_event_fields(events: list[dict[str, Any]]) -> None:
+def _validate_all(events: list[dict[str, Any]]) -> None:
+    """Single fused pass over events: required fields, counts, semantics, then lineage."""
+    ids: set[str] = set()
     for event in events:
-        for field in REQUIRED_FIELDS:
-            if field not in event:
-                raise AssertionError(f"Missing field {field} in event {event}")
+        if not (event.keys() >= REQUIRED_FIELDS):
+            missing = REQUIRED_FIELDS - event.keys()
+            raise AssertionError(f"Missing fields {sorted(missing)} in event {event}")
         if not isinstance(event["lineage"], list):
             raise AssertionError("lineage must be a list")
 
+        ids.add(event["decision_id"])
 
-def _validate_counts(events: list[dict[str, Any]]) -> None:
-    by_type: dict[str, int] = {}
-    for event in events:
-        by_type[event["decision_type"]] = by_type.get(event["decision_type"], 0) + 1
-    for key, expected in COUNTS_EXPECTED.items():
-        got = by_type.get(key, 0)
-        if got != expected:
-            raise AssertionError(f"Expected {expected} {key} events, found {got}")
-
-
-def _validate_lineage(events: list[dict[str, Any]]) -> None:
-    ids = {e["decision_id"] for e in events}
-    for event in events:
-        for parent in event["lineage"]:
-            if parent not in ids:
-                raise AssertionError(f"Unknown lineage decision_id {parent}")
-
-
-def _validate_semantics(events: list[dict[str, Any]]) -> None:
-    for event in events:
-        if _contains_placeholder(event):
+        # One serialization per event: the multi-pattern regex sweeps the
+        # whole blob instead of walking the structure per token.
+        blob = orjson.dumps(event)
+        if _PLACEHOLDER_RE.search(blob):
             raise AssertionError("Found placeholder semantics in decision trace")
 
         if event["decision_type"] == "PLAN_EVALUATED_POLICY":
@@ -97,35 +76,52 @@ def _validate_semantics(events: list[dict[str, Any]]) -> None:
             if not summary:
                 raise AssertionError("Planner must emit candidate_comparison_summary")
 
+    by_type = Counter(map(itemgetter("decision_type"), events))
+    for key, expected in COUNTS_EXPECTED.items():
+        got = by_type[key]
+        if got != expected:
+            raise AssertionError(f"Expected {expected} {key} events, found {got}")
+
+    # Lineage needs the full id set, so it runs after the main pass; the
+    # union/difference pair replaces the nested per-parent membership loop.
+    all_parents = set().union(*(event["lineage"] for event in events)) if events else set()
+    unknown = all_parents - ids
+    if unknown:
+        raise AssertionError(f"Unknown lineage decision_ids {sorted(unknown)}")
+
+
+def _verify_one_persona(persona: str) -> tuple[str, tuple[str, ...]]:
+    run_dir = Path("out/runs") / persona
+    if not run_dir.exists():
+        raise AssertionError(f"Missing run output directory for {persona}")
+
+    required = [
+        run_dir / "plain_trace.log",
+        run_dir / "decision_trace.jsonl",
+        run_dir / "budget_plan.md",
+        run_dir / "scorecard.json",
+    ]
+    for path in required:
+        if not path.exists():
+            raise AssertionError(f"Missing required artifact: {path}")
+
+    events = read_jsonl(run_dir / "decision_trace.jsonl")
+    _validate_all(events)
+
+    scorecard = read_json(run_dir / "scorecard.json")
+    selected_plan_name = scorecard["selected_plan"]["plan_name"]
+    driver_set = tuple(item["category"] for item in scorecard["top_drivers"])
+    return selected_plan_name, driver_set
+
 
 def verify_outputs() -> None:
-    selected_plan_names: list[str] = []
-    driver_sets: list[tuple[str, ...]] = []
-
-    for persona in CANONICAL_PERSONAS:
-        run_dir = Path("out/runs") / persona
-        if not run_dir.exists():
-            raise AssertionError(f"Missing run output directory for {persona}")
-
-        required = [
-            run_dir / "plain_trace.log",
-            run_dir / "decision_trace.jsonl",
-            run_dir / "budget_plan.md",
-            run_dir / "scorecard.json",
-        ]
-        for path in required:
-            if not path.exists():
-                raise AssertionError(f"Missing required artifact: {path}")
-
-        events = read_jsonl(run_dir / "decision_trace.jsonl")
-        _validate_event_fields(events)
-        _validate_counts(events)
-        _validate_lineage(events)
-        _validate_semantics(events)
-
-        scorecard = read_json(run_dir / "scorecard.json")
-        selected_plan_names.append(scorecard["selected_plan"]["plan_name"])
-        driver_sets.append(tuple(item["category"] for item in scorecard["top_drivers"]))
+    # Personas are independent and the workload mixes file IO with C-level
+    # parsing, so threads overlap well despite the GIL.
+    with ThreadPoolExecutor(max_workers=len(CANONICAL_PERSONAS)) as executor:
+        results = list(executor.map(_verify_one_persona, CANONICAL_PERSONAS))
+
+    selected_plan_names = [name for name, _ in results]
+    driver_sets = [drivers for _, drivers in results]
 
     if len(set(selected_plan_names)) == 1 and len(set(driver_sets)) == 1:
         raise AssertionError("Persona variation invariant failed: selected plans and drivers are identical")
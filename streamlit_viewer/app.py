@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import bisect
+import re
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pandas as pd
 import streamlit as st
 from st_aggrid import AgGrid, DataReturnMode, GridOptionsBuilder, GridUpdateMode
@@ -54,43 +56,113 @@ st.markdown(
 )
 
 
+@st.cache_data(ttl=5, show_spinner=False)
 def discover_personas(runs_root: Path) -> list[str]:
     if not runs_root.exists():
         return []
     return sorted([p.name for p in runs_root.iterdir() if p.is_dir()])
 
 
-def read_json(path: Path) -> dict[str, Any] | None:
-    if not path.exists():
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
         return None
+
+
+@st.cache_data(show_spinner=False)
+def _cached_json(path_str: str, mtime_ns: int) -> dict[str, Any] | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(Path(path_str).read_bytes())
     except Exception:
         return None
 
 
-def read_jsonl(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    events: list[dict[str, Any]] = []
+@st.cache_data(show_spinner=False)
+def _cached_jsonl(path_str: str, mtime_ns: int) -> list[dict[str, Any]]:
     try:
-        for line in path.read_text(encoding="utf-8").splitlines():
-            if line.strip():
-                events.append(json.loads(line))
+        with open(path_str, "rb", buffering=1 << 20) as f:
+            return [orjson.loads(line) for line in f if line.strip()]
     except Exception:
         return []
-    return events
 
 
-def read_text(path: Path) -> str | None:
-    if not path.exists():
-        return None
+@st.cache_data(show_spinner=False)
+def _cached_text(path_str: str, mtime_ns: int) -> str | None:
     try:
-        return path.read_text(encoding="utf-8")
+        return Path(path_str).read_text(encoding="utf-8")
     except Exception:
         return None
 
 
+@st.cache_data(show_spinner=False)
+def preprocess_events(path_str: str, mtime_ns: int) -> tuple[list[str], list[str], list[list[str]]]:
+    """Per-event keys, labels, and log needles, built once per trace instead of per rerun."""
+    events = _cached_jsonl(path_str, mtime_ns)
+    keys = [_event_key(e, idx) for idx, e in enumerate(events)]
+    labels = [_event_label(e) for e in events]
+    needles = [_event_needles(e) for e in events]
+    return keys, labels, needles
+
+
+_PLAN_COLUMNS = (
+    "plan_name",
+    "projected_savings",
+    "policy_status",
+    "risk_status",
+    "savings_transfer_amount",
+)
+
+
+@st.cache_data(show_spinner=False)
+def _plans_frame(path_str: str, mtime_ns: int) -> pd.DataFrame | None:
+    scorecard = _cached_json(path_str, mtime_ns)
+    plans = scorecard.get("plans") if isinstance(scorecard, dict) else None
+    if not isinstance(plans, list) or not plans:
+        return None
+    plan_cols = [c for c in _PLAN_COLUMNS if c in plans[0]]
+    if not plan_cols:
+        return None
+    return pd.DataFrame.from_records(plans, columns=plan_cols)
+
+
+@st.cache_data(show_spinner=False)
+def _events_frame(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Columnar view of the trace used for vectorized filtering."""
+    events = _cached_jsonl(path_str, mtime_ns)
+    return pd.DataFrame(
+        {
+            "actor": [str(e.get("actor", "")) for e in events],
+            "decision_type": [str(e.get("decision_type", "")) for e in events],
+            "_haystack": [
+                f"{e.get('actor', '')} {e.get('decision_type', '')} {e.get('decision_id', '')}".lower()
+                for e in events
+            ],
+        }
+    )
+
+
+def read_json(path: Path) -> dict[str, Any] | None:
+    mtime_ns = _mtime_ns(path)
+    if mtime_ns is None:
+        return None
+    return _cached_json(str(path), mtime_ns)
+
+
+def read_jsonl(path: Path) -> list[dict[str, Any]]:
+    mtime_ns = _mtime_ns(path)
+    if mtime_ns is None:
+        return []
+    return _cached_jsonl(str(path), mtime_ns)
+
+
+def read_text(path: Path) -> str | None:
+    mtime_ns = _mtime_ns(path)
+    if mtime_ns is None:
+        return None
+    return _cached_text(str(path), mtime_ns)
+
+
 def safe_get(obj: Any, keys: list[str], default: Any = None) -> Any:
     current = obj
     for key in keys:
@@ -149,23 +221,31 @@ def _event_needles(event: dict[str, Any]) -> list[str]:
     return [n for n in needles if n]
 
 
+@st.cache_data(show_spinner=False)
+def log_line_index(log_text: str) -> list[int]:
+    """Byte offsets of line starts, computed once per log instead of per snippet lookup."""
+    return [0] + [m.end() for m in re.finditer("\n", log_text)]
+
+
 def find_log_snippet(log_text: str, needles: list[str], radius: int = 16) -> str:
-    lines = log_text.splitlines()
-    if not lines:
+    if not log_text:
         return "No plain logs available."
 
-    hit_index = None
-    for idx, line in enumerate(lines):
-        if any(needle and needle in line for needle in needles):
-            hit_index = idx
-            break
+    real_needles = [needle for needle in needles if needle]
+    if not real_needles:
+        return "No related snippet found for selected event."
 
-    if hit_index is None:
+    pattern = re.compile("|".join(map(re.escape, real_needles)))
+    match = pattern.search(log_text)
+    if match is None:
         return "No related snippet found for selected event."
 
+    line_starts = log_line_index(log_text)
+    hit_index = bisect.bisect_right(line_starts, match.start()) - 1
     start = max(0, hit_index - radius)
-    end = min(len(lines), hit_index + radius + 1)
-    snippet = "\n".join(lines[start:end])
+    end = min(len(line_starts), hit_index + radius + 1)
+    snippet_end = line_starts[end] - 1 if end < len(line_starts) else len(log_text)
+    snippet = log_text[line_starts[start]:snippet_end].rstrip("\n")
     return snippet or "No related snippet found for selected event."
 
 
@@ -220,25 +300,29 @@ for label, path in [
 search_text = st.sidebar.text_input("Search", placeholder="actor / decision_type / decision_id")
 auto_select_key = st.sidebar.checkbox("Auto-select key event (FINAL_PLAN_SELECTED)", value=True)
 
-actors = sorted({str(e.get("actor", "")) for e in events if e.get("actor")})
-decision_types = sorted({str(e.get("decision_type", "")) for e in events if e.get("decision_type")})
+events_df = _events_frame(str(trace_path), _mtime_ns(trace_path) or 0)
+actors = sorted(a for a in events_df["actor"].unique() if a)
+decision_types = sorted(t for t in events_df["decision_type"].unique() if t)
 
 selected_actors = st.sidebar.multiselect("Actor filter", actors, default=actors)
 selected_types = st.sidebar.multiselect("Decision Type filter", decision_types, default=decision_types)
 
+event_keys, event_labels, event_needles_list = preprocess_events(str(trace_path), _mtime_ns(trace_path) or 0)
+
+filtered_idx: list[int] = []
 filtered_events: list[dict[str, Any]] = []
-for event in events:
-    actor = str(event.get("actor", ""))
-    dtype = str(event.get("decision_type", ""))
-    decision_id = str(event.get("decision_id", ""))
-    haystack = f"{actor} {dtype} {decision_id}".lower()
-    if selected_actors and actor not in selected_actors:
-        continue
-    if selected_types and dtype not in selected_types:
-        continue
-    if search_text and search_text.lower() not in haystack:
-        continue
-    filtered_events.append(event)
+if events:
+    mask = pd.Series(True, index=events_df.index)
+    if selected_actors:
+        mask &= events_df["actor"].isin(selected_actors)
+    if selected_types:
+        mask &= events_df["decision_type"].isin(selected_types)
+    if search_text:
+        mask &= events_df["_haystack"].str.contains(search_text.lower(), regex=False)
+    filtered_idx = list(events_df.index[mask])
+    filtered_events = [events[i] for i in filtered_idx]
+
+key_to_idx = {event_keys[i]: i for i in filtered_idx}
 
 st.title("Decision Trace Demo")
 st.caption("Inspect decisions by persona, compare explainable trace data with plain logs, and review the final budget plan.")
@@ -266,26 +350,17 @@ with k4:
     st.markdown(f'<div class="kpi-value">{selected_risk}</div>', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
-plans = safe_get(scorecard, ["plans"], []) if isinstance(scorecard, dict) else []
-if isinstance(plans, list) and plans:
-    df_plans = pd.DataFrame(plans)
-    wanted_cols = [
-        "plan_name",
-        "projected_savings",
-        "policy_status",
-        "risk_status",
-        "savings_transfer_amount",
-    ]
-    plan_cols = [c for c in wanted_cols if c in df_plans.columns]
-    if plan_cols:
-        st.markdown('<div class="card-title">Plans</div>', unsafe_allow_html=True)
-        st.dataframe(df_plans[plan_cols], use_container_width=True, hide_index=True)
+df_plans = _plans_frame(str(scorecard_path), _mtime_ns(scorecard_path) or 0)
+if df_plans is not None:
+    st.markdown('<div class="card-title">Plans</div>', unsafe_allow_html=True)
+    st.dataframe(df_plans, use_container_width=True, hide_index=True)
 
 trace_tab, logs_tab, budget_tab = st.tabs(["Decision Trace", "Plain Logs (Compare)", "Budget Plan"])
 
 with trace_tab:
     left, right = st.columns([1.3, 1.1])
     selected_event = None
+    selected_event_idx = None
 
     with left:
         st.markdown('<div class="card-title">Timeline</div>', unsafe_allow_html=True)
@@ -295,7 +370,7 @@ with trace_tab:
         else:
             timeline_rows = [
                 {
-                    "event_key": _event_key(e, idx),
+                    "event_key": event_keys[i],
                     "timestamp": e.get("timestamp", ""),
                     "actor": e.get("actor", ""),
                     "decision_type": e.get("decision_type", ""),
@@ -304,7 +379,7 @@ with trace_tab:
                     or safe_get(e, ["outcome", "risk_status"], None)
                     or "",
                 }
-                for idx, e in enumerate(filtered_events)
+                for i, e in zip(filtered_idx, filtered_events)
             ]
             timeline_df = pd.DataFrame(timeline_rows)
             key_to_event = {row["event_key"]: event for row, event in zip(timeline_rows, filtered_events)}
@@ -352,13 +427,17 @@ with trace_tab:
                     st.session_state["selected_event_key"] = picked_key
 
             selected_event = key_to_event.get(st.session_state["selected_event_key"], filtered_events[0])
+            selected_event_idx = key_to_idx.get(
+                st.session_state["selected_event_key"], filtered_idx[0] if filtered_idx else None
+            )
 
     with right:
         st.markdown('<div class="card-title">Decision Inspector</div>', unsafe_allow_html=True)
         if not selected_event:
             st.info("Choose an event to inspect.")
         else:
-            st.caption(f"Selected: {_event_label(selected_event)}")
+            label = event_labels[selected_event_idx] if selected_event_idx is not None else _event_label(selected_event)
+            st.caption(f"Selected: {label}")
             outcome = selected_event.get("outcome", {})
             status = (
                 safe_get(selected_event, ["outcome", "status"], "")
@@ -407,8 +486,8 @@ with trace_tab:
                     st.write("No lineage links.")
 
             with st.expander("Raw Event JSON"):
-                raw = json.dumps(selected_event, indent=2, sort_keys=True)
-                st.code(raw, language="json")
+                raw = orjson.dumps(selected_event, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+                st.code(raw.decode("utf-8"), language="json")
                 st.download_button(
                     "Download JSON",
                     data=raw,
@@ -423,10 +502,8 @@ with logs_tab:
 
     snippet = "No related snippet available."
     if filtered_events:
-        default_event = filtered_events[0]
-        snippet = find_log_snippet(plain_log, _event_needles(default_event), radius=20)
-        if 'selected_event' in locals() and selected_event:
-            snippet = find_log_snippet(plain_log, _event_needles(selected_event), radius=20)
+        snippet_idx = selected_event_idx if selected_event_idx is not None else filtered_idx[0]
+        snippet = find_log_snippet(plain_log, event_needles_list[snippet_idx], radius=20)
 
     st.markdown('<div class="card-title">Related Snippet</div>', unsafe_allow_html=True)
     st.code(snippet, language="text")
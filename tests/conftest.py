@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import orjson
+import pytest
+
+from dt_crewai_demo.pipeline import CANONICAL_PERSONAS
+
+
+# Artifact paths resolved once at import; pathlib joins are slow enough to
+# keep out of per-persona loops.
+TRACE_PATHS = {p: Path("out/runs") / p / "decision_trace.jsonl" for p in CANONICAL_PERSONAS}
+SCORECARD_PATHS = {p: Path("out/runs") / p / "scorecard.json" for p in CANONICAL_PERSONAS}
+
+
+def _load_events(path: Path) -> list:
+    with path.open("rb") as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture(scope="session")
+def persona_events():
+    """Parsed decision-trace events per persona, loaded once for the whole session."""
+    return {persona: _load_events(TRACE_PATHS[persona]) for persona in CANONICAL_PERSONAS}
+
+
+@pytest.fixture(scope="session")
+def persona_scorecards():
+    """Parsed scorecard.json per persona, loaded once for the whole session."""
+    return {persona: orjson.loads(SCORECARD_PATHS[persona].read_bytes()) for persona in CANONICAL_PERSONAS}
+
+
+@pytest.fixture(scope="session")
+def persona_raw():
+    """Raw decision-trace file bytes per persona, for tests that scan the file directly."""
+    return {persona: TRACE_PATHS[persona].read_bytes() for persona in CANONICAL_PERSONAS}
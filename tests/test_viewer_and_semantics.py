@@ -1,28 +1,36 @@
 from pathlib import Path
-import json
+import mmap
+import re
+
+import pytest
 
 from dt_crewai_demo.pipeline import CANONICAL_PERSONAS
 
 
 FORBIDDEN = ("Plan A", "Plan B", "Plan C", "Option 1", "Option 2")
+# Byte forms encoded once at import for the tests that scan raw file bytes.
+FORBIDDEN_B = tuple(token.encode("ascii") for token in FORBIDDEN)
+CANONICAL_PERSONAS_B = tuple(persona.encode("ascii") for persona in CANONICAL_PERSONAS)
+# One compiled alternation covers every forbidden token in a single linear
+# scan instead of one full-blob substring search per token. The tokens are
+# literal ASCII, so scanning the raw JSONL bytes is equivalent to scanning a
+# parse/re-serialize round-trip of them.
+FORBIDDEN_RE = re.compile(b"|".join(map(re.escape, FORBIDDEN_B)))
 
 
 def test_offline_viewer_exists_and_embeds_data():
     viewer = Path("out/decision_trace_view.html")
     assert viewer.exists()
-    html = viewer.read_text(encoding="utf-8")
-    assert "embedded-data" in html
-    for persona in CANONICAL_PERSONAS:
-        assert persona in html
-
-
-def test_no_placeholder_labels_in_user_fields():
-    for persona in CANONICAL_PERSONAS:
-        events = [
-            json.loads(line)
-            for line in (Path("out/runs") / persona / "decision_trace.jsonl").read_text(encoding="utf-8").splitlines()
-            if line.strip()
-        ]
-        blob = json.dumps(events)
-        for token in FORBIDDEN:
-            assert token not in blob
+    # mmap lets the substring checks run over lazily mapped pages instead of
+    # decoding the whole embedded-JSON file into a str.
+    with viewer.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert mm.find(b"embedded-data") != -1
+        for persona_b in CANONICAL_PERSONAS_B:
+            assert mm.find(persona_b) != -1
+
+
+@pytest.mark.parametrize("persona", CANONICAL_PERSONAS)
+def test_no_placeholder_labels_in_user_fields(persona, persona_raw):
+    match = FORBIDDEN_RE.search(persona_raw[persona])
+    if match:
+        pytest.fail(f"placeholder {match.group().decode()!r} present in {persona} trace")